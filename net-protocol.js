@@ -23,9 +23,28 @@ const SEL = {
   getValueAtIndex: "0xf3724377" // getValueAtIndex(bytes32 key, address operator, uint256 idx) → (string, bytes)
 };
 
+// ABI interfaces, parsed once at load instead of on every build/decode
+const PUT_IFACE = new ethers.Interface([
+  "function put(bytes32 key, string text, bytes value)"
+]);
+const GET_IFACE = new ethers.Interface([
+  "function get(bytes32,address) returns (string text, bytes value)"
+]);
+
 class NetProtocol {
   constructor() {
-    this.provider = new ethers.JsonRpcProvider(RPC);
+    this._provider = null;
+  }
+
+  // Created on first read, so encode/build-only use never sets up an RPC provider.
+  // A static network skips the eth_chainId probe ethers otherwise sends before the first call.
+  get provider() {
+    if (!this._provider) {
+      this._provider = new ethers.JsonRpcProvider(RPC, CHAIN_ID, {
+        staticNetwork: ethers.Network.from(CHAIN_ID)
+      });
+    }
+    return this._provider;
   }
 
   // --- Key Encoding ---
@@ -40,7 +59,7 @@ class NetProtocol {
       const hex = Buffer.from(key, "utf8").toString("hex");
       return "0x" + hex.padStart(64, "0");
     } else {
-      return ethers.solidityPackedKeccak256(["string"], [key]);
+      return ethers.keccak256(ethers.toUtf8Bytes(key));
     }
   }
 
@@ -86,10 +105,7 @@ class NetProtocol {
   // Returns Bankr-compatible transaction JSON
   buildStore(key, text, value) {
     const keyBytes = NetProtocol.encodeKey(key);
-    const iface = new ethers.Interface([
-      "function put(bytes32 key, string text, bytes value)"
-    ]);
-    const data = iface.encodeFunctionData("put", [
+    const data = PUT_IFACE.encodeFunctionData("put", [
       keyBytes,
       text || "",
       ethers.toUtf8Bytes(value)
@@ -108,10 +124,7 @@ class NetProtocol {
   static decodeGetResponse(hex) {
     if (!hex || hex === "0x" || hex.length < 130) return null;
     try {
-      const iface = new ethers.Interface([
-        "function get(bytes32,address) returns (string text, bytes value)"
-      ]);
-      const decoded = iface.decodeFunctionResult("get", hex);
+      const decoded = GET_IFACE.decodeFunctionResult("get", hex);
       return {
         text: decoded.text,
         value: ethers.toUtf8String(decoded.value)
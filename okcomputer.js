@@ -33,15 +33,23 @@ const CONTRACT_NFT = "0xce2830932889c7fb5e5206287c43554e673dcc88";
 const CONTRACT_STORAGE = "0x04D7C8b512D5455e20df1E808f12caD1e3d766E5";
 const RPC_URL = "https://base-mainnet.g.alchemy.com/v2/gx18Gx0VA7vJ9o_iYr4VkWUS8GE3AQ1G";
 const CHAIN_ID = 8453;
+const MULTICALL3 = "0xcA11bde05977b3631167028862bE2a173976CA11";
 
-const SELECTORS = {
+// Computed once at load; frozen since the object is exported and shared by every instance
+const SELECTORS = Object.freeze({
   submitMessage: ethers.id("submitMessage(uint256,bytes32,string,uint256)").slice(0, 10),
   getMessageCount: ethers.id("getMessageCount(bytes32)").slice(0, 10),
   getMessage: ethers.id("getMessage(bytes32,uint256)").slice(0, 10),
   storeString: ethers.id("storeString(uint256,bytes32,string)").slice(0, 10),
   getStringOrDefault: ethers.id("getStringOrDefault(uint256,bytes32,string)").slice(0, 10),
   ownerOf: ethers.id("ownerOf(uint256)").slice(0, 10),
-};
+  aggregate3: ethers.id("aggregate3((address,bool,bytes)[])").slice(0, 10),
+});
+
+// Raw selector bytes for calldata assembled in a Buffer
+const SELECTOR_BYTES = Object.freeze(
+  Object.fromEntries(Object.entries(SELECTORS).map(([name, hex]) => [name, Buffer.from(hex.slice(2), "hex")]))
+);
 
 const CHANNELS = {
   board: "Main message board — public posts visible to all",
@@ -55,11 +63,158 @@ const CHANNELS = {
 
 const MAX_PAGE_SIZE = 65536;
 const MAX_USERNAME_LENGTH = 16;
+const READ_PAGE_SIZE = 50; // messages per batched request when streaming a channel
+
+// --- Channel Keys ---
+
+const CHANNEL_KEY_CACHE_SIZE = 256;
+
+/**
+ * keccak256 of the raw UTF-8 bytes. Same result as solidityPackedKeccak256(["string"], [channel]),
+ * since a packed string is just its bytes, but skips the packed-encoding layer.
+ */
+function hashChannel(channel) {
+  return ethers.keccak256(ethers.toUtf8Bytes(channel));
+}
+
+// Well-known channel keys, computed once at load and never evicted
+const CHANNEL_KEYS = new Map(Object.keys(CHANNELS).map((channel) => [channel, hashChannel(channel)]));
+
+// Least-recently-used cache for every other channel (email_*, rg_*, custom keys)
+const channelKeys = new Map();
+
+// --- HTTP ---
+
+const RPC_TIMEOUT_MS = 15000;
+const RPC_RETRIES = 3;
+const RPC_BACKOFF_MS = 200; // doubles on each retry
+const RETRY_STATUSES = new Set([429, 502, 503, 504]);
+const RPC_BATCH_LIMIT = 100; // calls per batch request; public providers reject larger arrays
+const MULTICALL_LIMIT = 100; // getMessage calls per Multicall3 aggregate3 call
 
 // --- ABI Coder ---
 
 const coder = ethers.AbiCoder.defaultAbiCoder();
 
+// Hand-rolled encoders/decoders for the fixed call layouts used here.
+
+const UINT256_LIMIT = 1n << 256n;
+
+/** Encode a uint256 as a 32-byte word. */
+function uintWord(n) {
+  const value = BigInt(n);
+  if (value < 0n || value >= UINT256_LIMIT) throw new RangeError(`Value out of uint256 range: ${n}`);
+  return value.toString(16).padStart(64, "0");
+}
+
+/**
+ * Assemble calldata for head words followed by one dynamic string tail.
+ * `str` may be a string or its already-encoded UTF-8 Buffer.
+ * Everything is written into a single buffer and hex-encoded once.
+ */
+function encodeCall(selector, words, str) {
+  const bytes = Buffer.isBuffer(str) ? str : Buffer.from(str, "utf8");
+  const tailStart = 4 + 32 * (words.length + 1);
+  const out = Buffer.alloc(tailStart + Math.ceil(bytes.length / 32) * 32);
+  selector.copy(out, 0);
+  words.forEach((word, i) => out.write(word, 4 + 32 * i, "hex"));
+  out.write(uintWord(bytes.length), tailStart - 32, "hex");
+  bytes.copy(out, tailStart);
+  return "0x" + out.toString("hex");
+}
+
+/** Encode a (uint256 tokenId, bytes32 key, string) call — storeString / getStringOrDefault. */
+function encodeStore(selector, tokenId, key, str) {
+  return encodeCall(selector, [uintWord(tokenId), key.slice(2), uintWord(0x60)], str);
+}
+
+/** Encode a (uint256 tokenId, bytes32 key, string text, uint256 metadata) call — submitMessage. */
+function encodeSubmit(selector, tokenId, key, text, metadata) {
+  return encodeCall(selector, [uintWord(tokenId), key.slice(2), uintWord(0x80), uintWord(metadata)], text);
+}
+
+/** Decode a hex string, with or without "0x", to bytes. */
+function hexToBytes(hex) {
+  return Buffer.from(hex.startsWith("0x") ? hex.slice(2) : hex, "hex");
+}
+
+/** Read the 32-byte word at a byte offset of ABI data as a BigInt. */
+function readWord(buf, offset) {
+  if (offset + 32 > buf.length) throw new Error(`ABI data too short: no word at offset ${offset}`);
+  let value = 0n;
+  for (let i = 0; i < 32; i += 8) value = (value << 64n) | buf.readBigUInt64BE(offset + i);
+  return value;
+}
+
+/** Read the dynamic string whose length word sits at a byte offset of ABI data. */
+function readString(buf, offset) {
+  const length = Number(readWord(buf, offset));
+  const end = offset + 32 + length;
+  if (end > buf.length) throw new Error("ABI data too short: truncated string");
+  return buf.toString("utf8", offset + 32, end);
+}
+
+/** Decode a single ABI-encoded string return value. */
+function decodeString(result) {
+  const buf = hexToBytes(result);
+  return readString(buf, Number(readWord(buf, 0)));
+}
+
+/**
+ * Decode getMessage()'s (bytes32,uint256,uint256,address,uint256,string) return value.
+ * Reads the tuple head at fixed offsets and slices the string out of the tail.
+ */
+function decodeMessageTuple(result) {
+  const buf = hexToBytes(result);
+  const base = Number(readWord(buf, 0));
+  readWord(buf, base + 96); // bounds check before slicing the address
+  return {
+    tokenId: Number(readWord(buf, base + 32)),
+    timestamp: Number(readWord(buf, base + 64)),
+    sender: ethers.getAddress("0x" + buf.toString("hex", base + 108, base + 128)),
+    metadata: Number(readWord(buf, base + 128)),
+    text: readString(buf, base + Number(readWord(buf, base + 160))),
+  };
+}
+
+// --- Message ---
+
+/** A decoded channel message. Fields are fixed at construction so every instance shares one shape. */
+class Message {
+  #time = null;
+
+  constructor(index, tokenId, timestamp, sender, metadata, text) {
+    this.index = index;
+    this.tokenId = tokenId;
+    this.timestamp = timestamp;
+    this.sender = sender;
+    this.metadata = metadata;
+    this.text = text;
+  }
+
+  /** ISO-8601 time, formatted on first access — most scans only look at `text`. */
+  get time() {
+    if (this.#time === null) this.#time = new Date(this.timestamp * 1000).toISOString();
+    return this.#time;
+  }
+
+  /**
+   * Plain-object form, matching the message objects returned before Message existed.
+   * `time` is a getter, so spread and `Object.keys` leave it out; use this to get all fields.
+   */
+  toJSON() {
+    return {
+      index: this.index,
+      tokenId: this.tokenId,
+      timestamp: this.timestamp,
+      time: this.time,
+      sender: this.sender,
+      metadata: this.metadata,
+      text: this.text,
+    };
+  }
+}
+
 // --- OKComputer Class ---
 
 class OKComputer {
@@ -70,77 +225,286 @@ class OKComputer {
 
   /** Convert a channel name to its bytes32 key (keccak256 hash). */
   channelKey(channel) {
-    return ethers.solidityPackedKeccak256(["string"], [channel]);
+    let key = CHANNEL_KEYS.get(channel);
+    if (key !== undefined) return key;
+    key = channelKeys.get(channel);
+    if (key !== undefined) {
+      // Re-insert so Map order tracks recency and eviction drops the least recently used
+      channelKeys.delete(channel);
+    } else {
+      key = hashChannel(channel);
+      if (channelKeys.size >= CHANNEL_KEY_CACHE_SIZE) channelKeys.delete(channelKeys.keys().next().value);
+    }
+    channelKeys.set(channel, key);
+    return key;
+  }
+
+  /**
+   * POST a JSON-RPC payload and parse the response.
+   * Rate limits (429), gateway errors and network failures are retried with exponential backoff —
+   * every call made here is a read-only eth_call, so retrying is always safe.
+   */
+  async _post(payload) {
+    const body = JSON.stringify(payload);
+    for (let attempt = 0; ; attempt++) {
+      try {
+        return await this._send(body);
+      } catch (e) {
+        if (!e.retryable || attempt >= RPC_RETRIES) throw e;
+        const delay = Math.max(RPC_BACKOFF_MS * 2 ** attempt, e.retryAfterMs || 0);
+        await new Promise((resolve) => setTimeout(resolve, delay));
+      }
+    }
+  }
+
+  /**
+   * Send one POST request. Rejects with `retryable` set for transient failures; errors from an
+   * HTTP response carry its `status`.
+   */
+  async _send(body) {
+    let resp;
+    try {
+      resp = await fetch(this.rpcUrl, {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body,
+        signal: AbortSignal.timeout(RPC_TIMEOUT_MS),
+      });
+    } catch (e) {
+      const reason = e.name === "TimeoutError" ? `timed out after ${RPC_TIMEOUT_MS}ms` : e.message;
+      const err = new Error(`RPC request failed: ${reason}`);
+      err.retryable = true;
+      throw err;
+    }
+    if (RETRY_STATUSES.has(resp.status)) {
+      await resp.body?.cancel();
+      const retryAfter = Number(resp.headers.get("retry-after"));
+      const err = new Error(`RPC HTTP ${resp.status}`);
+      err.retryable = true;
+      err.status = resp.status;
+      if (Number.isFinite(retryAfter)) err.retryAfterMs = Math.min(retryAfter * 1000, RPC_TIMEOUT_MS);
+      throw err;
+    }
+    try {
+      return await resp.json();
+    } catch {
+      const err = new Error(`RPC HTTP ${resp.status}: invalid JSON response`);
+      err.status = resp.status;
+      throw err;
+    }
   }
 
   /** Make a read-only eth_call to the blockchain. */
   async rpcCall(to, data) {
-    const resp = await fetch(this.rpcUrl, {
-      method: "POST",
-      headers: { "Content-Type": "application/json" },
-      body: JSON.stringify({
-        jsonrpc: "2.0",
-        method: "eth_call",
-        params: [{ to, data }, "latest"],
-        id: 1,
-      }),
+    const result = await this._post({
+      jsonrpc: "2.0",
+      method: "eth_call",
+      params: [{ to, data }, "latest"],
+      id: 1,
     });
-    const result = await resp.json();
-    if (result.error) throw new Error(`RPC error: ${JSON.stringify(result.error)}`);
+    if (result.error) {
+      const err = new Error(`RPC error: ${JSON.stringify(result.error)}`);
+      err.rpcError = true;
+      throw err;
+    }
     if (!result.result) throw new Error(`Unexpected RPC response: ${JSON.stringify(result)}`);
     return result.result;
   }
 
+  /**
+   * Make several read-only eth_calls in one JSON-RPC batch request.
+   * Returns results in call order; entries for calls that failed are Error instances.
+   * Throws with `batchRejected` set if the node rejects the batch as a whole.
+   */
+  async rpcBatch(calls) {
+    if (calls.length === 0) return [];
+    if (calls.length > RPC_BATCH_LIMIT) {
+      // Sub-batches go out one after another so a large read doesn't burst the provider
+      const results = [];
+      for (let i = 0; i < calls.length; i += RPC_BATCH_LIMIT) {
+        results.push(...(await this.rpcBatch(calls.slice(i, i + RPC_BATCH_LIMIT))));
+      }
+      return results;
+    }
+    let body;
+    try {
+      body = await this._post(
+        calls.map(([to, data], id) => ({
+          jsonrpc: "2.0",
+          method: "eth_call",
+          params: [{ to, data }, "latest"],
+          id,
+        }))
+      );
+    } catch (e) {
+      // A non-retryable 4xx (plain-text 400 "batch not supported", 413 too large) refuses the batch itself
+      if (!e.retryable && e.status >= 400 && e.status < 500) e.batchRejected = true;
+      throw e;
+    }
+    if (!Array.isArray(body)) {
+      const err = new Error(`RPC batch rejected: ${JSON.stringify(body.error || body)}`);
+      err.batchRejected = true;
+      throw err;
+    }
+    const results = new Array(calls.length).fill(null);
+    for (const item of body) {
+      if (typeof item.id !== "number" || item.id < 0 || item.id >= calls.length) continue;
+      if (item.error) results[item.id] = new Error(`RPC error: ${JSON.stringify(item.error)}`);
+      else if (!item.result) results[item.id] = new Error(`Unexpected RPC response: ${JSON.stringify(item)}`);
+      else results[item.id] = item.result;
+    }
+    return results.map((r) => r ?? new Error("Missing response in RPC batch"));
+  }
+
+  /**
+   * Make several eth_calls concurrently, one request each.
+   * Returns results in call order; entries for calls that failed are Error instances.
+   */
+  async rpcEach(calls) {
+    return Promise.all(calls.map(([to, data]) => this.rpcCall(to, data).catch((e) => e)));
+  }
+
+  /**
+   * Make several eth_calls, batched when the node allows it, concurrently otherwise.
+   * Only a rejected batch falls back; transport and rate-limit failures propagate,
+   * rather than fanning out into N more requests against a node that is already failing.
+   */
+  async _rpcMany(calls) {
+    try {
+      return await this.rpcBatch(calls);
+    } catch (e) {
+      if (!e.batchRejected) throw e;
+      // Some providers reject batch requests — fall back to concurrent individual calls
+      return this.rpcEach(calls);
+    }
+  }
+
   // --- Read Operations (no wallet needed) ---
 
-  /** Get the wallet address that owns a token. */
+  /** Get the wallet address that owns a token (EIP-55 checksummed). */
   async getOwner(tokenId) {
+    return ethers.getAddress(await this.getOwnerRaw(tokenId));
+  }
+
+  /**
+   * Get the owner address lowercased, skipping the checksum's extra keccak256.
+   * Use when the address only feeds back into calldata or comparisons.
+   */
+  async getOwnerRaw(tokenId) {
     const tid = tokenId ?? this.tokenId;
-    const data = SELECTORS.ownerOf + coder.encode(["uint256"], [tid]).slice(2);
+    const data = SELECTORS.ownerOf + uintWord(tid);
     const result = await this.rpcCall(CONTRACT_NFT, data);
-    return ethers.getAddress("0x" + result.slice(-40));
+    if (result.length !== 66) throw new Error(`Unexpected ownerOf result: ${result}`);
+    return "0x" + result.slice(-40).toLowerCase();
   }
 
   /** Get the total number of messages in a channel. */
   async getMessageCount(channel) {
     const key = this.channelKey(channel);
-    const data = SELECTORS.getMessageCount + coder.encode(["bytes32"], [key]).slice(2);
+    const data = SELECTORS.getMessageCount + key.slice(2);
     const result = await this.rpcCall(CONTRACT_STORAGE, data);
     return Number(BigInt(result));
   }
 
   /** Read a single message by index from a channel. */
-  async getMessage(channel, index) {
-    const key = this.channelKey(channel);
-    const data = SELECTORS.getMessage + coder.encode(["bytes32", "uint256"], [key, index]).slice(2);
+  async getMessage(channel, index, prefix = this._messagePrefix(channel)) {
+    const data = prefix + uintWord(index);
     const result = await this.rpcCall(CONTRACT_STORAGE, data);
-    const decoded = coder.decode(
-      ["(bytes32,uint256,uint256,address,uint256,string)"],
-      result
-    );
-    const msg = decoded[0];
-    return {
-      index,
-      tokenId: Number(msg[1]),
-      timestamp: Number(msg[2]),
-      time: new Date(Number(msg[2]) * 1000).toISOString(),
-      sender: msg[3],
-      metadata: Number(msg[4]),
-      text: msg[5],
-    };
+    return this._decodeMessage(index, result);
+  }
+
+  /** getMessage() calldata up to the index word: selector + channel key. Same for every index. */
+  _messagePrefix(channel) {
+    return SELECTORS.getMessage + this.channelKey(channel).slice(2);
+  }
+
+  /** Decode a getMessage() return value into a message object. */
+  _decodeMessage(index, result) {
+    const msg = decodeMessageTuple(result);
+    return new Message(index, msg.tokenId, msg.timestamp, msg.sender, msg.metadata, msg.text);
   }
 
   /** Read the last N messages from a channel. */
   async readChannel(channel, count = 10) {
+    const messages = [];
+    for await (const msg of this.iterChannel(channel, count)) messages.push(msg);
+    return messages;
+  }
+
+  /**
+   * Stream the last N messages from a channel, oldest first.
+   * Fetches one batched page at a time, so memory stays bounded and callers can stop early.
+   */
+  async *iterChannel(channel, count = 10, pageSize = READ_PAGE_SIZE) {
+    if (!Number.isInteger(pageSize) || pageSize < 1) {
+      throw new RangeError(`pageSize must be a positive integer, got ${pageSize}`);
+    }
+    const total = await this.getMessageCount(channel);
+    for (let start = Math.max(0, total - count); start < total; start += pageSize) {
+      yield* await this._readRange(channel, start, Math.min(start + pageSize, total));
+    }
+  }
+
+  /** Read messages [start, end) from a channel in a single batched request. */
+  async _readRange(channel, start, end) {
+    const calls = this._messageCalldata(channel, start, end).map((data) => [CONTRACT_STORAGE, data]);
+    const results = await this._rpcMany(calls);
+    return results.map((result, j) => this._decodeResult(start + j, result));
+  }
+
+  /** getMessage() calldata for every index in [start, end). */
+  _messageCalldata(channel, start, end) {
+    const prefix = this._messagePrefix(channel);
+    const calldata = [];
+    for (let i = start; i < end; i++) {
+      calldata.push(prefix + uintWord(i));
+    }
+    return calldata;
+  }
+
+  /** Turn one getMessage() result (or the Error it failed with) into a message or error entry. */
+  _decodeResult(index, result) {
+    if (result instanceof Error) return { index, error: result.message };
+    try {
+      return this._decodeMessage(index, result);
+    } catch (e) {
+      return { index, error: e.message };
+    }
+  }
+
+  /**
+   * Read the last N messages from a channel through the Multicall3 aggregator:
+   * one eth_call executes every getMessage() in a single EVM context.
+   */
+  async multicallReadChannel(channel, count = 10) {
     const total = await this.getMessageCount(channel);
     const start = Math.max(0, total - count);
+    return this._multicallRange(channel, start, total);
+  }
+
+  /**
+   * Read messages [start, end) via Multicall3, MULTICALL_LIMIT messages per aggregate3 call.
+   * A slice the node refuses with a JSON-RPC error (gas or response limits) is read with a
+   * JSON-RPC batch instead; transport failures and decode errors propagate.
+   */
+  async _multicallRange(channel, start, end) {
     const messages = [];
-    for (let i = start; i < total; i++) {
+    for (let from = start; from < end; from += MULTICALL_LIMIT) {
+      const to = Math.min(from + MULTICALL_LIMIT, end);
+      const calls = this._messageCalldata(channel, from, to).map((data) => [CONTRACT_STORAGE, true, data]);
+      const params = coder.encode(["(address,bool,bytes)[]"], [calls]);
+      let result;
       try {
-        messages.push(await this.getMessage(channel, i));
+        result = await this.rpcCall(MULTICALL3, SELECTORS.aggregate3 + params.slice(2));
       } catch (e) {
-        messages.push({ index: i, error: e.message });
+        if (!e.rpcError) throw e;
+        messages.push(...(await this._readRange(channel, from, to)));
+        continue;
       }
+      const returned = coder.decode(["(bool,bytes)[]"], result)[0];
+      returned.forEach(([success, data], j) => {
+        messages.push(this._decodeResult(from + j, success ? data : new Error("getMessage reverted")));
+      });
     }
     return messages;
   }
@@ -159,22 +523,18 @@ class OKComputer {
   async readPage(tokenId) {
     const tid = tokenId ?? this.tokenId;
     const key = this.channelKey("page");
-    const params = coder.encode(["uint256", "bytes32", "string"], [tid, key, ""]);
-    const data = SELECTORS.getStringOrDefault + params.slice(2);
+    const data = encodeStore(SELECTOR_BYTES.getStringOrDefault, tid, key, "");
     const result = await this.rpcCall(CONTRACT_STORAGE, data);
-    const decoded = coder.decode(["string"], result);
-    return decoded[0];
+    return decodeString(result);
   }
 
   /** Read a token's username. */
   async readUsername(tokenId) {
     const tid = tokenId ?? this.tokenId;
     const key = this.channelKey("username");
-    const params = coder.encode(["uint256", "bytes32", "string"], [tid, key, ""]);
-    const data = SELECTORS.getStringOrDefault + params.slice(2);
+    const data = encodeStore(SELECTOR_BYTES.getStringOrDefault, tid, key, "");
     const result = await this.rpcCall(CONTRACT_STORAGE, data);
-    const decoded = coder.decode(["string"], result);
-    return decoded[0];
+    return decodeString(result);
   }
 
   /** Read emails (DMs) sent to this token. */
@@ -187,37 +547,36 @@ class OKComputer {
   async readData(keyName, tokenId) {
     const tid = tokenId ?? this.tokenId;
     const key = this.channelKey(keyName);
-    const params = coder.encode(["uint256", "bytes32", "string"], [tid, key, ""]);
-    const data = SELECTORS.getStringOrDefault + params.slice(2);
+    const data = encodeStore(SELECTOR_BYTES.getStringOrDefault, tid, key, "");
     const result = await this.rpcCall(CONTRACT_STORAGE, data);
-    const decoded = coder.decode(["string"], result);
-    return decoded[0];
+    return decodeString(result);
   }
 
   /** Read ALL messages from a channel (not just last N). */
   async readAllMessages(channel) {
-    const total = await this.getMessageCount(channel);
-    const messages = [];
-    for (let i = 0; i < total; i++) {
-      try {
-        messages.push(await this.getMessage(channel, i));
-      } catch (e) {
-        messages.push({ index: i, error: e.message });
-      }
-    }
-    return messages;
+    return this.readChannel(channel, Infinity);
   }
 
   /** Get message counts for all main channels. */
   async getNetworkStats() {
+    const channels = ["board", "gm", "ok", "suggest", "announcement"];
+    const calls = channels.map((channel) => [CONTRACT_STORAGE, SELECTORS.getMessageCount + this.channelKey(channel).slice(2)]);
+    let results;
+    try {
+      results = await this._rpcMany(calls);
+    } catch (e) {
+      results = channels.map(() => e);
+    }
     const stats = {};
-    for (const channel of ["board", "gm", "ok", "suggest", "announcement"]) {
+    channels.forEach((channel, i) => {
+      // A channel that fails or returns undecodable data reports 0, as when counts were fetched one by one
       try {
-        stats[channel] = await this.getMessageCount(channel);
+        if (results[i] instanceof Error) throw results[i];
+        stats[channel] = Number(BigInt(results[i]));
       } catch {
         stats[channel] = 0;
       }
-    }
+    });
     return stats;
   }
 
@@ -236,22 +595,17 @@ class OKComputer {
   /** Build a transaction to post a message to a channel. */
   buildPostMessage(channel, text) {
     const key = this.channelKey(channel);
-    const params = coder.encode(
-      ["uint256", "bytes32", "string", "uint256"],
-      [this.tokenId, key, text, 0]
-    );
-    return this._buildTx(SELECTORS.submitMessage + params.slice(2));
+    return this._buildTx(encodeSubmit(SELECTOR_BYTES.submitMessage, this.tokenId, key, text, 0));
   }
 
   /** Build a transaction to set the token's webpage. Max 64KB, self-contained HTML. */
   buildSetPage(html) {
-    const size = Buffer.byteLength(html, "utf8");
-    if (size > MAX_PAGE_SIZE) {
-      throw new Error(`Page HTML exceeds ${MAX_PAGE_SIZE} bytes. Current: ${size}`);
+    const bytes = Buffer.from(html, "utf8");
+    if (bytes.length > MAX_PAGE_SIZE) {
+      throw new Error(`Page HTML exceeds ${MAX_PAGE_SIZE} bytes. Current: ${bytes.length}`);
     }
     const key = this.channelKey("page");
-    const params = coder.encode(["uint256", "bytes32", "string"], [this.tokenId, key, html]);
-    return this._buildTx(SELECTORS.storeString + params.slice(2));
+    return this._buildTx(encodeStore(SELECTOR_BYTES.storeString, this.tokenId, key, bytes));
   }
 
   /** Build a transaction to set the token's display name. Max 16 characters. */
@@ -260,8 +614,7 @@ class OKComputer {
       throw new Error(`Username exceeds ${MAX_USERNAME_LENGTH} characters`);
     }
     const key = this.channelKey("username");
-    const params = coder.encode(["uint256", "bytes32", "string"], [this.tokenId, key, username]);
-    return this._buildTx(SELECTORS.storeString + params.slice(2));
+    return this._buildTx(encodeStore(SELECTOR_BYTES.storeString, this.tokenId, key, username));
   }
 
   /** Build a transaction to send an email (DM) to another OK Computer. */
@@ -271,13 +624,12 @@ class OKComputer {
 
   /** Build a transaction to store arbitrary string data onchain. Max 64KB. */
   buildStoreData(keyName, data) {
-    const size = Buffer.byteLength(data, "utf8");
-    if (size > MAX_PAGE_SIZE) {
+    const bytes = Buffer.from(data, "utf8");
+    if (bytes.length > MAX_PAGE_SIZE) {
       throw new Error(`Data exceeds ${MAX_PAGE_SIZE} bytes`);
     }
     const key = this.channelKey(keyName);
-    const params = coder.encode(["uint256", "bytes32", "string"], [this.tokenId, key, data]);
-    return this._buildTx(SELECTORS.storeString + params.slice(2));
+    return this._buildTx(encodeStore(SELECTOR_BYTES.storeString, this.tokenId, key, bytes));
   }
 
   // --- Utility ---
@@ -323,7 +675,17 @@ class OKComputer {
 
 // --- Exports ---
 
-module.exports = { OKComputer, CONTRACT_NFT, CONTRACT_STORAGE, CHAIN_ID, CHANNELS, SELECTORS, MAX_PAGE_SIZE };
+module.exports = {
+  OKComputer,
+  Message,
+  CONTRACT_NFT,
+  CONTRACT_STORAGE,
+  MULTICALL3,
+  CHAIN_ID,
+  CHANNELS,
+  SELECTORS,
+  MAX_PAGE_SIZE,
+};
 
 // --- CLI ---
 
@@ -0,0 +1,762 @@
+#!/usr/bin/env node
+/**
+ * OK Computers — Test Suite
+ *
+ * Run: node test-okcomputer.js
+ */
+
+const http = require("http");
+const { ethers } = require("ethers");
+const { OKComputer, Message, SELECTORS, MAX_PAGE_SIZE, MULTICALL3, CONTRACT_NFT, CONTRACT_STORAGE } = require("./okcomputer");
+
+const coder = ethers.AbiCoder.defaultAbiCoder();
+
+let passed = 0;
+let failed = 0;
+const failures = [];
+
+function test(name, fn) {
+  try {
+    fn();
+    passed++;
+    console.log(`  \u2713 ${name}`);
+  } catch (e) {
+    failed++;
+    failures.push({ name, error: e.message });
+    console.log(`  \u2717 ${name}: ${e.message}`);
+  }
+}
+
+function assert(cond, msg) {
+  if (!cond) throw new Error(msg || "Assertion failed");
+}
+
+function assertEqual(a, b, msg) {
+  if (a !== b) throw new Error(msg || `Expected ${JSON.stringify(b)}, got ${JSON.stringify(a)}`);
+}
+
+const ok = new OKComputer(1399);
+
+// ============================================================
+console.log("\n=== SELECTORS ===\n");
+// ============================================================
+
+test("SELECTORS is frozen", () => {
+  assert(Object.isFrozen(SELECTORS), "SELECTORS should be frozen");
+  try {
+    SELECTORS.ownerOf = "0xdeadbeef";
+  } catch {}
+  assertEqual(SELECTORS.ownerOf, "0x6352211e");
+});
+
+test("Known selectors", () => {
+  assertEqual(SELECTORS.ownerOf, "0x6352211e");
+  assertEqual(SELECTORS.aggregate3, "0x82ad56cb");
+});
+
+// ============================================================
+console.log("\n=== CHANNEL KEYS ===\n");
+// ============================================================
+
+test("channelKey matches solidityPackedKeccak256", () => {
+  for (const channel of ["board", "gm", "email_42", "rg_1399_broadcast", "", "gm ☕"]) {
+    assertEqual(ok.channelKey(channel), ethers.solidityPackedKeccak256(["string"], [channel]));
+  }
+});
+
+test("channelKey is stable across calls and instances", () => {
+  assertEqual(ok.channelKey("email_7"), new OKComputer(1).channelKey("email_7"));
+  assertEqual(ok.channelKey("email_7"), ok.channelKey("email_7"));
+});
+
+test("channelKey stays correct after heavy cache churn", () => {
+  for (let i = 0; i < 1000; i++) ok.channelKey(`email_${i}`);
+  for (const channel of ["board", "page", "email_0", "email_999"]) {
+    assertEqual(ok.channelKey(channel), ethers.solidityPackedKeccak256(["string"], [channel]));
+  }
+});
+
+// ============================================================
+console.log("\n=== CALLDATA ENCODING ===\n");
+// ============================================================
+
+const SAMPLE_STRINGS = [
+  "",
+  "hello mfers!",
+  "x".repeat(32),
+  "y".repeat(33),
+  "gm ☕ \u{1F44B} — ok",
+  "<h1>" + "z".repeat(1000) + "</h1>",
+];
+
+test("buildPostMessage matches ABI coder", () => {
+  for (const text of SAMPLE_STRINGS) {
+    const key = ok.channelKey("board");
+    const expected = coder.encode(["uint256", "bytes32", "string", "uint256"], [1399, key, text, 0]);
+    assertEqual(ok.buildPostMessage("board", text).data, SELECTORS.submitMessage + expected.slice(2));
+  }
+});
+
+test("buildSetPage matches ABI coder", () => {
+  for (const html of SAMPLE_STRINGS) {
+    const key = ok.channelKey("page");
+    const expected = coder.encode(["uint256", "bytes32", "string"], [1399, key, html]);
+    assertEqual(ok.buildSetPage(html).data, SELECTORS.storeString + expected.slice(2));
+  }
+});
+
+test("buildStoreData matches ABI coder", () => {
+  for (const data of SAMPLE_STRINGS) {
+    const key = ok.channelKey("mykey");
+    const expected = coder.encode(["uint256", "bytes32", "string"], [1399, key, data]);
+    assertEqual(ok.buildStoreData("mykey", data).data, SELECTORS.storeString + expected.slice(2));
+  }
+});
+
+test("buildSetUsername matches ABI coder", () => {
+  const key = ok.channelKey("username");
+  const expected = coder.encode(["uint256", "bytes32", "string"], [1399, key, "MyBot"]);
+  assertEqual(ok.buildSetUsername("MyBot").data, SELECTORS.storeString + expected.slice(2));
+});
+
+test("buildSendEmail posts to the target's email channel", () => {
+  const key = ok.channelKey("email_42");
+  const expected = coder.encode(["uint256", "bytes32", "string", "uint256"], [1399, key, "hey #42!", 0]);
+  assertEqual(ok.buildSendEmail(42, "hey #42!").data, SELECTORS.submitMessage + expected.slice(2));
+});
+
+test("getMessage calldata matches ABI coder", () => {
+  for (const channel of ["board", "email_42", "gm ☕"]) {
+    const key = ok.channelKey(channel);
+    const prefix = ok._messagePrefix(channel);
+    const calldata = ok._messageCalldata(channel, 0, 3);
+    for (const i of [0, 1, 2]) {
+      const expected = SELECTORS.getMessage + coder.encode(["bytes32", "uint256"], [key, i]).slice(2);
+      assertEqual(prefix + i.toString(16).padStart(64, "0"), expected);
+      assertEqual(calldata[i], expected);
+    }
+  }
+});
+
+test("Large token IDs encode like the ABI coder", () => {
+  const big = new OKComputer(2n ** 255n);
+  const key = big.channelKey("board");
+  const expected = coder.encode(["uint256", "bytes32", "string", "uint256"], [2n ** 255n, key, "hi", 0]);
+  assertEqual(big.buildPostMessage("board", "hi").data, SELECTORS.submitMessage + expected.slice(2));
+});
+
+test("Negative token ID is rejected", () => {
+  let threw = false;
+  try {
+    new OKComputer(-1).buildPostMessage("board", "hi");
+  } catch {
+    threw = true;
+  }
+  assert(threw, "Should have thrown for negative token ID");
+});
+
+// ============================================================
+console.log("\n=== MESSAGE DECODING ===\n");
+// ============================================================
+
+const SENDER = "0x000000000000000000000000000000000000dEaD";
+
+function encodeMessage(tokenId, timestamp, metadata, text) {
+  return coder.encode(
+    ["(bytes32,uint256,uint256,address,uint256,string)"],
+    [[ethers.ZeroHash, tokenId, timestamp, SENDER, metadata, text]]
+  );
+}
+
+test("Decodes getMessage return data like the ABI coder", () => {
+  for (const text of SAMPLE_STRINGS) {
+    const msg = ok._decodeMessage(7, encodeMessage(1399, 1700000000, 3, text));
+    assertEqual(msg.index, 7);
+    assertEqual(msg.tokenId, 1399);
+    assertEqual(msg.timestamp, 1700000000);
+    assertEqual(msg.sender, SENDER);
+    assertEqual(msg.metadata, 3);
+    assertEqual(msg.text, text);
+  }
+});
+
+test("Decoded messages are Message instances", () => {
+  const msg = ok._decodeMessage(0, encodeMessage(1399, 1700000000, 0, "hi"));
+  assert(msg instanceof Message, "Should be a Message");
+  assertEqual(msg.time, "2023-11-14T22:13:20.000Z");
+});
+
+test("Message serializes to the plain message shape", () => {
+  const msg = ok._decodeMessage(4, encodeMessage(1399, 1700000000, 0, "hi"));
+  assertEqual(
+    JSON.stringify(msg),
+    JSON.stringify({
+      index: 4,
+      tokenId: 1399,
+      timestamp: 1700000000,
+      time: "2023-11-14T22:13:20.000Z",
+      sender: SENDER,
+      metadata: 0,
+      text: "hi",
+    })
+  );
+});
+
+test("Message exposes only its data fields as own properties", () => {
+  const msg = ok._decodeMessage(4, encodeMessage(1399, 1700000000, 0, "hi"));
+  msg.time; // populate the cache
+  assertEqual(Object.keys(msg).join(), "index,tokenId,timestamp,sender,metadata,text");
+  assertEqual(Object.keys({ ...msg }).join(), "index,tokenId,timestamp,sender,metadata,text");
+});
+
+test("Rejects truncated message data", () => {
+  const encoded = encodeMessage(1399, 1700000000, 0, "hello there");
+  let threw = false;
+  try {
+    ok._decodeMessage(0, encoded.slice(0, encoded.length - 64));
+  } catch {
+    threw = true;
+  }
+  assert(threw, "Should have thrown for truncated data");
+});
+
+test("Rejects empty return data", () => {
+  let threw = false;
+  try {
+    ok._decodeMessage(0, "0x");
+  } catch {
+    threw = true;
+  }
+  assert(threw, "Should have thrown for empty data");
+});
+
+// ============================================================
+console.log("\n=== VALIDATION ===\n");
+// ============================================================
+
+test("buildSetPage rejects oversized HTML", () => {
+  let threw = false;
+  try {
+    ok.buildSetPage("x".repeat(MAX_PAGE_SIZE + 1));
+  } catch {
+    threw = true;
+  }
+  assert(threw, "Should have thrown for oversized page");
+});
+
+test("buildSetPage accepts exactly MAX_PAGE_SIZE bytes", () => {
+  const tx = ok.buildSetPage("x".repeat(MAX_PAGE_SIZE));
+  assert(tx.data.startsWith(SELECTORS.storeString));
+});
+
+test("buildSetUsername rejects long names", () => {
+  let threw = false;
+  try {
+    ok.buildSetUsername("x".repeat(17));
+  } catch {
+    threw = true;
+  }
+  assert(threw, "Should have thrown for long username");
+});
+
+// ============================================================
+// NETWORK — driven against a local JSON-RPC server
+// ============================================================
+
+async function testAsync(name, fn) {
+  try {
+    await fn();
+    passed++;
+    console.log(`  \u2713 ${name}`);
+  } catch (e) {
+    failed++;
+    failures.push({ name, error: e.message });
+    console.log(`  \u2717 ${name}: ${e.message}`);
+  }
+}
+
+/** ABI-encode a uint256 return value. */
+function word(n) {
+  return "0x" + BigInt(n).toString(16).padStart(64, "0");
+}
+
+/**
+ * Run `fn(ok, requests)` against a local HTTP server. `handler(payload, res)` returns the
+ * JSON reply, or undefined after writing `res` itself. `requests` records every payload.
+ */
+async function withRpcServer(handler, fn) {
+  const requests = [];
+  const server = http.createServer((req, res) => {
+    let body = "";
+    req.on("data", (chunk) => (body += chunk));
+    req.on("end", () => {
+      const payload = JSON.parse(body);
+      requests.push(payload);
+      const reply = handler(payload, res);
+      if (reply !== undefined) {
+        res.setHeader("Content-Type", "application/json");
+        res.end(JSON.stringify(reply));
+      }
+    });
+  });
+  await new Promise((resolve) => server.listen(0, "127.0.0.1", resolve));
+  try {
+    await fn(new OKComputer(1399, `http://127.0.0.1:${server.address().port}`), requests);
+  } finally {
+    server.closeAllConnections();
+    await new Promise((resolve) => server.close(resolve));
+  }
+}
+
+/** Answer every eth_call in a single or batch payload with `result(call, id)`. */
+function answerAll(result) {
+  return (payload) => {
+    const reply = (req) => ({ jsonrpc: "2.0", id: req.id, result: result(req.params[0], req.id) });
+    return Array.isArray(payload) ? payload.map(reply) : reply(payload);
+  };
+}
+
+(async () => {
+  // ============================================================
+  console.log("\n=== JSON-RPC BATCHING ===\n");
+  // ============================================================
+
+  await testAsync("rpcBatch sends one request and returns results in call order", async () => {
+    const handler = (payload) =>
+      payload.map((req) => ({ jsonrpc: "2.0", id: req.id, result: word(req.id * 10) })).reverse();
+    await withRpcServer(handler, async (ok, requests) => {
+      const calls = [0, 1, 2, 3].map((i) => ["0x01", "0x" + i]);
+      const results = await ok.rpcBatch(calls);
+      assertEqual(requests.length, 1);
+      assertEqual(results.join(), [word(0), word(10), word(20), word(30)].join());
+    });
+  });
+
+  await testAsync("rpcBatch turns errors and missing or unknown ids into Error entries", async () => {
+    const handler = () => [
+      { jsonrpc: "2.0", id: 0, result: word(7) },
+      { jsonrpc: "2.0", id: 2, error: { code: 3, message: "execution reverted" } },
+      { jsonrpc: "2.0", id: 99, result: word(1) },
+      { jsonrpc: "2.0", id: "0", result: word(1) },
+    ];
+    await withRpcServer(handler, async (ok) => {
+      const results = await ok.rpcBatch([["0x01", "0x"], ["0x01", "0x"], ["0x01", "0x"]]);
+      assertEqual(results[0], word(7));
+      assert(results[1] instanceof Error && /Missing/.test(results[1].message), "id 1 should be missing");
+      assert(results[2] instanceof Error && /reverted/.test(results[2].message), "id 2 should carry its error");
+    });
+  });
+
+  await testAsync("rpcBatch tags a batch the node rejects outright", async () => {
+    const handler = () => ({ jsonrpc: "2.0", id: null, error: { code: -32600, message: "batch not supported" } });
+    await withRpcServer(handler, async (ok) => {
+      let err = null;
+      try {
+        await ok.rpcBatch([["0x01", "0x"]]);
+      } catch (e) {
+        err = e;
+      }
+      assert(err && err.batchRejected, "Should throw with batchRejected set");
+    });
+  });
+
+  await testAsync("Rejected batch falls back to one request per call", async () => {
+    const single = answerAll((call) => word(Number(call.data)));
+    const handler = (payload) =>
+      Array.isArray(payload) ? { jsonrpc: "2.0", id: null, error: { code: -32600, message: "no batches" } } : single(payload);
+    await withRpcServer(handler, async (ok, requests) => {
+      const results = await ok._rpcMany([["0x01", "0x5"], ["0x01", "0x6"], ["0x01", "0x7"]]);
+      assertEqual(results.join(), [word(5), word(6), word(7)].join());
+      assertEqual(requests.length, 4); // rejected batch + 3 single calls
+    });
+  });
+
+  await testAsync("Batch refused with a plain-text 400 or a 413 falls back to one request per call", async () => {
+    for (const status of [400, 413]) {
+      const single = answerAll((call) => word(Number(call.data)));
+      const handler = (payload, res) => {
+        if (!Array.isArray(payload)) return single(payload);
+        res.statusCode = status;
+        res.end("batch requests not supported");
+      };
+      await withRpcServer(handler, async (ok, requests) => {
+        const results = await ok._rpcMany([["0x01", "0x5"], ["0x01", "0x6"], ["0x01", "0x7"]]);
+        assertEqual(results.join(), [word(5), word(6), word(7)].join());
+        assertEqual(requests.length, 4); // refused batch + 3 single calls
+      });
+    }
+  });
+
+  await testAsync("Rate-limited batch propagates instead of fanning out", async () => {
+    const handler = (payload, res) => {
+      res.statusCode = 429;
+      res.end("slow down");
+    };
+    await withRpcServer(handler, async (ok, requests) => {
+      let threw = false;
+      try {
+        await ok._rpcMany([["0x01", "0x5"], ["0x01", "0x6"], ["0x01", "0x7"]]);
+      } catch {
+        threw = true;
+      }
+      assert(threw, "Should have thrown");
+      assertEqual(requests.length, 4); // first attempt + 3 retries, all batched
+      assert(requests.every(Array.isArray), "Should never fall back to single calls");
+    });
+  });
+
+  await testAsync("Large batches are split into sequential sub-batches", async () => {
+    let inFlight = 0;
+    let maxInFlight = 0;
+    const answer = answerAll((call) => word(Number(call.data)));
+    const handler = (payload, res) => {
+      maxInFlight = Math.max(maxInFlight, ++inFlight);
+      setTimeout(() => {
+        inFlight--;
+        res.setHeader("Content-Type", "application/json");
+        res.end(JSON.stringify(answer(payload)));
+      }, 10);
+      return undefined;
+    };
+    await withRpcServer(handler, async (ok, requests) => {
+      const calls = Array.from({ length: 250 }, (_, i) => ["0x01", "0x" + i.toString(16)]);
+      const results = await ok.rpcBatch(calls);
+      assertEqual(requests.map((r) => r.length).join(), "100,100,50");
+      assertEqual(maxInFlight, 1);
+      assert(results.every((r, i) => r === word(i)), "Results out of order");
+    });
+  });
+
+  // ============================================================
+  console.log("\n=== RETRIES ===\n");
+  // ============================================================
+
+  /** Fail the first `failures` requests with `status` (and optional headers), then answer normally. */
+  function flaky(failures, status, headers = {}) {
+    const answer = answerAll(() => word(42));
+    return (payload, res) => {
+      if (failures-- > 0) {
+        res.writeHead(status, headers);
+        res.end("try again");
+        return undefined;
+      }
+      return answer(payload);
+    };
+  }
+
+  await testAsync("Transient gateway errors are retried", async () => {
+    await withRpcServer(flaky(2, 503), async (ok, requests) => {
+      assertEqual(await ok.rpcCall("0x01", "0x"), word(42));
+      assertEqual(requests.length, 3);
+    });
+  });
+
+  await testAsync("Retry-After is honored on 429", async () => {
+    await withRpcServer(flaky(1, 429, { "Retry-After": "1" }), async (ok, requests) => {
+      const started = Date.now();
+      assertEqual(await ok.rpcCall("0x01", "0x"), word(42));
+      assert(Date.now() - started >= 900, "Should have waited for Retry-After");
+      assertEqual(requests.length, 2);
+    });
+  });
+
+  await testAsync("Client errors are not retried", async () => {
+    await withRpcServer(flaky(1, 400), async (ok, requests) => {
+      let threw = false;
+      try {
+        await ok.rpcCall("0x01", "0x");
+      } catch {
+        threw = true;
+      }
+      assert(threw, "Should have thrown");
+      assertEqual(requests.length, 1);
+    });
+  });
+
+  // ============================================================
+  console.log("\n=== NETWORK STATS ===\n");
+  // ============================================================
+
+  await testAsync("getMessageCount and getNetworkStats send ABI-encoded calldata", async () => {
+    await withRpcServer(answerAll(() => word(12)), async (ok, requests) => {
+      assertEqual(await ok.getMessageCount("board"), 12);
+      await ok.getNetworkStats();
+      const channels = ["board", "board", "gm", "ok", "suggest", "announcement"];
+      const expected = channels.map(
+        (channel) => SELECTORS.getMessageCount + coder.encode(["bytes32"], [ok.channelKey(channel)]).slice(2)
+      );
+      const sent = [requests[0].params[0].data, ...requests[1].map((r) => r.params[0].data)];
+      assertEqual(sent.join(), expected.join());
+      assert([requests[0], ...requests[1]].every((r) => r.params[0].to === CONTRACT_STORAGE), "Should call CONTRACT_STORAGE");
+    });
+  });
+
+  await testAsync("getNetworkStats fetches all counts in one batch", async () => {
+    await withRpcServer(answerAll((call, id) => word(id + 1)), async (ok, requests) => {
+      const stats = await ok.getNetworkStats();
+      assertEqual(JSON.stringify(stats), JSON.stringify({ board: 1, gm: 2, ok: 3, suggest: 4, announcement: 5 }));
+      assertEqual(requests.length, 1);
+    });
+  });
+
+  await testAsync("getNetworkStats reports 0 for a failed or undecodable channel", async () => {
+    const handler = (payload) =>
+      payload.map((req) =>
+        req.id === 1
+          ? { jsonrpc: "2.0", id: 1, result: "0x" }
+          : req.id === 3
+          ? { jsonrpc: "2.0", id: 3, error: { code: 3, message: "execution reverted" } }
+          : { jsonrpc: "2.0", id: req.id, result: word(9) }
+      );
+    await withRpcServer(handler, async (ok) => {
+      const stats = await ok.getNetworkStats();
+      assertEqual(JSON.stringify(stats), JSON.stringify({ board: 9, gm: 0, ok: 9, suggest: 0, announcement: 9 }));
+    });
+  });
+
+  await testAsync("getNetworkStats reports 0 everywhere when the request fails", async () => {
+    const handler = (payload, res) => {
+      res.end("<html>bad gateway</html>");
+    };
+    await withRpcServer(handler, async (ok) => {
+      const stats = await ok.getNetworkStats();
+      assertEqual(Object.values(stats).join(), "0,0,0,0,0");
+    });
+  });
+
+  /** Message index encoded in the trailing word of getMessage() calldata. */
+  const indexOf = (data) => Number(BigInt("0x" + data.slice(-64)));
+  const messageAt = (i) => encodeMessage(1399, 1700000000 + i, 0, `msg ${i}`);
+
+  /**
+   * A node holding `total` messages. aggregate3 calls get `aggregate(calls)`'s reply;
+   * batched or single getMessage calls are answered directly.
+   */
+  function messageNode(total, aggregate) {
+    return (payload) => {
+      if (Array.isArray(payload)) {
+        return payload.map((req) => ({ jsonrpc: "2.0", id: req.id, result: messageAt(indexOf(req.params[0].data)) }));
+      }
+      const call = payload.params[0];
+      if (call.data.startsWith(SELECTORS.getMessageCount)) return { jsonrpc: "2.0", id: payload.id, result: word(total) };
+      if (call.to === MULTICALL3) {
+        const calls = coder.decode(["(address,bool,bytes)[]"], "0x" + call.data.slice(10))[0];
+        return { jsonrpc: "2.0", id: payload.id, ...aggregate(calls.map((c) => indexOf(c[2]))) };
+      }
+      return { jsonrpc: "2.0", id: payload.id, result: messageAt(indexOf(call.data)) };
+    };
+  }
+
+  const aggregateOk = (revertIndex) => (indices) => ({
+    result: coder.encode(
+      ["(bool,bytes)[]"],
+      [indices.map((i) => (i === revertIndex ? [false, "0x"] : [true, messageAt(i)]))]
+    ),
+  });
+
+  // ============================================================
+  console.log("\n=== STREAMING ===\n");
+  // ============================================================
+
+  await testAsync("getMessage sends the same calldata with or without a precomputed prefix", async () => {
+    await withRpcServer(messageNode(10, aggregateOk(-1)), async (ok, requests) => {
+      const prefix = ok._messagePrefix("board");
+      const plain = await ok.getMessage("board", 7);
+      const prefixed = await ok.getMessage("board", 7, prefix);
+      const expected = SELECTORS.getMessage + coder.encode(["bytes32", "uint256"], [ok.channelKey("board"), 7]).slice(2);
+      assertEqual(requests[0].params[0].data, expected);
+      assertEqual(requests[1].params[0].data, expected);
+      assertEqual(JSON.stringify(prefixed), JSON.stringify(plain));
+      assertEqual(prefixed.text, "msg 7");
+    });
+  });
+
+  await testAsync("iterChannel reads one batch per page, oldest first", async () => {
+    await withRpcServer(messageNode(120, aggregateOk(-1)), async (ok, requests) => {
+      const indices = [];
+      for await (const msg of ok.iterChannel("board", 110, 50)) indices.push(msg.index);
+      assertEqual(indices.length, 110);
+      assert(indices.every((index, i) => index === 10 + i), "Messages out of order");
+      assertEqual(requests.filter(Array.isArray).map((r) => r.length).join(), "50,50,10");
+    });
+  });
+
+  await testAsync("iterChannel stops fetching when the consumer stops", async () => {
+    await withRpcServer(messageNode(500, aggregateOk(-1)), async (ok, requests) => {
+      let seen = 0;
+      for await (const msg of ok.iterChannel("board", Infinity, 50)) {
+        if (++seen === 3) break;
+      }
+      assertEqual(requests.filter(Array.isArray).length, 1);
+    });
+  });
+
+  await testAsync("readChannel and readAllMessages collect every page", async () => {
+    await withRpcServer(messageNode(120, aggregateOk(-1)), async (ok) => {
+      assertEqual((await ok.readChannel("board", 7)).map((m) => m.index).join(), "113,114,115,116,117,118,119");
+      assertEqual((await ok.readAllMessages("board")).length, 120);
+    });
+  });
+
+  await testAsync("iterChannel rejects page sizes that are not positive integers", async () => {
+    await withRpcServer(messageNode(10, aggregateOk(-1)), async (ok, requests) => {
+      for (const pageSize of [0, -5, NaN, 2.5]) {
+        let threw = false;
+        try {
+          for await (const msg of ok.iterChannel("board", 10, pageSize)) void msg;
+        } catch (e) {
+          threw = e instanceof RangeError;
+        }
+        assert(threw, `Should have thrown RangeError for pageSize ${pageSize}`);
+      }
+      assertEqual(requests.length, 0);
+    });
+  });
+
+  // ============================================================
+  console.log("\n=== MULTICALL3 ===\n");
+  // ============================================================
+
+  await testAsync("multicallReadChannel decodes aggregate3 results in one call", async () => {
+    await withRpcServer(messageNode(5, aggregateOk(3)), async (ok, requests) => {
+      const messages = await ok.multicallReadChannel("board", 3);
+      assertEqual(messages.map((m) => m.index).join(), "2,3,4");
+      assertEqual(messages[0].text, "msg 2");
+      assertEqual(messages[2].timestamp, 1700000004);
+      assert(/reverted/.test(messages[1].error), "Reverted sub-call should be an error entry");
+      assertEqual(requests.length, 2); // count + one aggregate3
+    });
+  });
+
+  await testAsync("multicallReadChannel splits large ranges into fixed-size aggregate3 calls", async () => {
+    await withRpcServer(messageNode(250, aggregateOk(-1)), async (ok, requests) => {
+      const messages = await ok.multicallReadChannel("board", Infinity);
+      assertEqual(messages.length, 250);
+      assert(messages.every((m, i) => m.index === i && m.text === `msg ${i}`), "Messages out of order");
+      const sizes = requests
+        .filter((r) => !Array.isArray(r) && r.params[0].to === MULTICALL3)
+        .map((r) => coder.decode(["(address,bool,bytes)[]"], "0x" + r.params[0].data.slice(10))[0].length);
+      assertEqual(sizes.join(), "100,100,50");
+    });
+  });
+
+  await testAsync("multicallReadChannel falls back to a batch when aggregate3 errors", async () => {
+    const refuse = () => ({ error: { code: -32000, message: "out of gas" } });
+    await withRpcServer(messageNode(4, refuse), async (ok, requests) => {
+      const messages = await ok.multicallReadChannel("board", 4);
+      assertEqual(messages.map((m) => m.text).join(), "msg 0,msg 1,msg 2,msg 3");
+      assertEqual(requests.filter(Array.isArray).length, 1);
+    });
+  });
+
+  await testAsync("multicallReadChannel propagates transport failures without falling back", async () => {
+    const count = messageNode(4, aggregateOk(-1));
+    const handler = (payload, res) => {
+      if (!Array.isArray(payload) && payload.params[0].to === MULTICALL3) {
+        res.end("<html>bad gateway</html>");
+        return undefined;
+      }
+      return count(payload);
+    };
+    await withRpcServer(handler, async (ok, requests) => {
+      let threw = false;
+      try {
+        await ok.multicallReadChannel("board", 4);
+      } catch {
+        threw = true;
+      }
+      assert(threw, "Should have thrown");
+      assertEqual(requests.filter(Array.isArray).length, 0);
+    });
+  });
+
+  // ============================================================
+  console.log("\n=== STORAGE READS ===\n");
+  // ============================================================
+
+  await testAsync("readPage, readUsername and readData send getStringOrDefault calldata", async () => {
+    await withRpcServer(answerAll(() => coder.encode(["string"], [""])), async (ok, requests) => {
+      await ok.readPage();
+      await ok.readUsername();
+      await ok.readData("mykey", 42);
+      const expected = [[1399, "page"], [1399, "username"], [42, "mykey"]].map(
+        ([tid, name]) =>
+          SELECTORS.getStringOrDefault + coder.encode(["uint256", "bytes32", "string"], [tid, ok.channelKey(name), ""]).slice(2)
+      );
+      assertEqual(requests.map((r) => r.params[0].data).join(), expected.join());
+      assert(requests.every((r) => r.params[0].to === CONTRACT_STORAGE), "Should read from CONTRACT_STORAGE");
+    });
+  });
+
+  await testAsync("String reads decode like the ABI coder", async () => {
+    let value;
+    await withRpcServer(answerAll(() => coder.encode(["string"], [value])), async (ok) => {
+      for (value of SAMPLE_STRINGS) {
+        assertEqual(await ok.readPage(), value);
+        assertEqual(await ok.readUsername(), value);
+        assertEqual(await ok.readData("mykey"), value);
+      }
+    });
+  });
+
+  await testAsync("String reads reject truncated data", async () => {
+    const encoded = coder.encode(["string"], ["hello mfers!"]);
+    await withRpcServer(answerAll(() => encoded.slice(0, encoded.length - 64)), async (ok) => {
+      for (const read of [() => ok.readPage(), () => ok.readUsername(), () => ok.readData("mykey")]) {
+        let threw = false;
+        try {
+          await read();
+        } catch {
+          threw = true;
+        }
+        assert(threw, "Should have thrown for truncated data");
+      }
+    });
+  });
+
+  // ============================================================
+  console.log("\n=== OWNERSHIP ===\n");
+  // ============================================================
+
+  await testAsync("getOwnerRaw returns the lowercased owner, getOwner the checksummed one", async () => {
+    const owner = "0x000000000000000000000000000000000000dEaD";
+    const handler = answerAll(() => "0x" + "0".repeat(24) + owner.slice(2).toUpperCase());
+    await withRpcServer(handler, async (ok, requests) => {
+      assertEqual(await ok.getOwnerRaw(), owner.toLowerCase());
+      assertEqual(await ok.getOwner(), owner);
+      assertEqual(requests[0].params[0].to, CONTRACT_NFT);
+      assertEqual(requests[0].params[0].data, SELECTORS.ownerOf + word(1399).slice(2));
+    });
+  });
+
+  await testAsync("getOwnerRaw rejects a result that is not one 32-byte word", async () => {
+    for (const result of ["0x", word(1) + "00"]) {
+      await withRpcServer(answerAll(() => result), async (ok) => {
+        let threw = false;
+        try {
+          await ok.getOwnerRaw();
+        } catch {
+          threw = true;
+        }
+        assert(threw, `Should have thrown for ${result}`);
+      });
+    }
+  });
+
+  // ============================================================
+  // RESULTS
+  // ============================================================
+
+  console.log(`\n${"=".repeat(50)}`);
+  console.log(`  RESULTS: ${passed} passed, ${failed} failed, ${passed + failed} total`);
+  console.log(`${"=".repeat(50)}`);
+
+  if (failures.length > 0) {
+    console.log("\nFailed tests:");
+    for (const f of failures) {
+      console.log(`  - ${f.name}: ${f.error}`);
+    }
+  }
+
+  process.exit(failed > 0 ? 1 : 0);
+})();